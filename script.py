@@ -1,9 +1,25 @@
+import bisect
 import csv
 import datetime
+import functools
+import heapq
+import importlib.util
+import io
+import itertools
+import operator
+import os
 import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable, Sequence
 import tkinter as tk
 from tkinter import font
 
+# pyarrow is optional and slow to import, so only check it is available
+# here; it is imported when a schedule is actually large enough to use it.
+_HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
 # --- Configuration ---
 # For testing, read from example.csv instead of the full schedule.
 SCHEDULE_FILE = 'example.csv'
@@ -13,6 +29,11 @@ SCHEDULE_FILE = 'example.csv'
 # set to the appropriate conference day; for development you can
 # leave it as "today" so tests line up with the current clock.
 CONFERENCE_DATE = datetime.date.today()
+_CONF_Y, _CONF_M, _CONF_D = CONFERENCE_DATE.year, CONFERENCE_DATE.month, CONFERENCE_DATE.day
+
+# Schedules larger than this are parsed with PyArrow's C++ CSV reader
+# when it is installed; smaller files aren't worth its setup cost.
+PYARROW_MIN_FILE_SIZE = 64 * 1024
 
 # --- Colour palette (roughly matching the schedule screenshots) ---
 PALETTE_BASE_BG = "#f6c049"   # yellow for breaks / general background
@@ -23,8 +44,226 @@ PALETTE_TEXT_LIGHT = "#ffffff"  # white text on orange
 # --- Constants for State Display ---
 SECONDS_BEFORE_INTERMISSION_WARNING = 5 * 60  # 5 minutes in seconds
 
+# Serialises schedule loading so displays starting in parallel (one
+# process driving several rooms) share a single parse of the file.
+_LOAD_LOCK = threading.Lock()
+
+# The display only redraws when something on it can change, but never
+# sleeps longer than this so it stays robust to clock adjustments.
+MAX_UPDATE_INTERVAL_MS = 60 * 1000
+
+
+@dataclass(slots=True, frozen=True)
+class Event:
+    """A single schedule entry for one room."""
+    track: str | None
+    date: datetime.date
+    type: str
+    # True for talks/workshops, False for breaks and social events.
+    is_session: bool
+    start: datetime.datetime
+    end: datetime.datetime
+    # Start/end as whole POSIX seconds for cheap comparisons in the update loop.
+    start_ts: int
+    end_ts: int
+    speaker: str
+    title: str
+    synopsis: str
+    # Display strings, formatted once at load time rather than every tick.
+    start_hhmm: str
+    end_hhmm: str
+    main_text: str
+    following_text: str
+
+
+def _parse_date(date_str: str) -> datetime.date:
+    """Parse a YYYY-MM-DD date, slicing fixed-width input directly."""
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        return datetime.date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+    return datetime.datetime.strptime(date_str, '%Y-%m-%d').date()
+
+
+def _parse_time(time_str: str) -> tuple[int, int]:
+    """Parse an HH:MM time into (hour, minute), slicing fixed-width input directly.
+
+    Range checking is left to the datetime the result is used to build.
+    """
+    if len(time_str) == 5 and time_str[2] == ':':
+        return int(time_str[0:2]), int(time_str[3:5])
+    parsed = datetime.datetime.strptime(time_str, '%H:%M')
+    return parsed.hour, parsed.minute
+
+
+def _field(row: Sequence[str], index: int | None, default: str = '') -> str:
+    """Return a column of a stripped row, or default if missing or empty."""
+    if index is None or index >= len(row):
+        return default
+    return row[index] or default
+
+
+def _read_rows_csv(filename: str) -> tuple[list[str] | None, Iterable[Sequence[str]]]:
+    """Read a CSV with the csv module, returning (header, rows)."""
+    with open(filename, mode='rb') as file:
+        data = file.read()
+    # Schedules are nearly always plain ASCII, which latin-1 decodes in one
+    # tight loop with no multi-byte state; anything else (e.g. accented
+    # speaker names) is decoded as UTF-8, dropping a BOM if present.
+    text = data.decode('latin-1') if data.isascii() else data.decode('utf-8-sig')
+    reader = csv.reader(io.StringIO(text, newline=''))
+    return next(reader, None), reader
+
+
+def _read_rows_pyarrow(filename: str) -> tuple[list[str] | None, Iterable[Sequence[str]]]:
+    """Read a CSV with PyArrow's C++ reader, returning (header, rows).
+
+    Every column is kept as a string so rows match csv.reader output and go
+    through the same validation. PyArrow rejects rows whose column count
+    differs from the header (such as short rows or comment lines); those are
+    re-read with the csv module so they are handled exactly as on the
+    csv path.
+    """
+    # pyarrow ships without type information and is optional
+    import pyarrow as pa  # type: ignore[import-not-found, import-untyped, unused-ignore]
+    import pyarrow.csv as pa_csv  # type: ignore[import-not-found, import-untyped, unused-ignore]
+
+    with open(filename, mode='r', newline='', encoding='utf-8-sig') as file:
+        header = next(csv.reader(file), None)
+    if header is None:
+        return None, ()
+
+    uneven_rows: list[str] = []
+
+    def keep_uneven_row(row):
+        uneven_rows.append(row.text)
+        return 'skip'
+
+    table = pa_csv.read_csv(
+        filename,
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True, invalid_row_handler=keep_uneven_row),
+        convert_options=pa_csv.ConvertOptions(column_types={name: pa.string() for name in header}),
+    )
+    rows = zip(*(column.to_pylist() for column in table.columns))
+    return header, itertools.chain(rows, csv.reader(uneven_rows))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_all(filename: str, mtime_ns: int) -> dict[str | None, list[Event]]:
+    """Parse the whole schedule CSV once, grouping Events by track.
+
+    Each track's list is sorted by start time; events without a Track are
+    stored under None. ``mtime_ns`` is only used as part of the cache key,
+    so editing the file invalidates the cached parse. Callers must not
+    mutate the returned lists.
+    """
+    by_track: dict[str | None, list[Event]] = {}
+    if _HAS_PYARROW and os.path.getsize(filename) > PYARROW_MIN_FILE_SIZE:
+        header, rows = _read_rows_pyarrow(filename)
+    else:
+        header, rows = _read_rows_csv(filename)
+    if header is None:
+        return by_track
+    # Resolve column positions once rather than building a dict per row
+    header_index = {name: i for i, name in enumerate(header)}
+    track_col = header_index.get('Track')
+    date_col = header_index.get('Date')
+    start_col = header_index.get('Start Time')
+    duration_col = header_index.get('Duration')
+    speaker_col = header_index.get('Speaker')
+    title_cols = [header_index.get(name) for name in ('Talk Title', 'Title', 'Speaker/Title')]
+    synopsis_col = header_index.get('Synopsis')
+    type_col = header_index.get('Type')
+
+    for row in rows:
+        # Strip every cell in one pass rather than field by field
+        cells = list(map(str.strip, row))
+
+        # Parse date (per-row) or fall back to configured conference date
+        date_str = _field(cells, date_col)
+        if date_str:
+            try:
+                date_obj = _parse_date(date_str)
+            except ValueError:
+                # If format is unexpected, skip this row rather than crash
+                continue
+        else:
+            date_obj = CONFERENCE_DATE
+
+        # Parse start time
+        time_str = _field(cells, start_col)
+        if not time_str:
+            continue
+        try:
+            hour, minute = _parse_time(time_str)
+            # Build the datetime in one constructor call rather than
+            # combining separate date and time objects.
+            if date_str:
+                start_datetime = datetime.datetime(date_obj.year, date_obj.month, date_obj.day, hour, minute)
+            else:
+                start_datetime = datetime.datetime(_CONF_Y, _CONF_M, _CONF_D, hour, minute)
+        except ValueError:
+            continue
+
+        # Duration and end time
+        duration_str = _field(cells, duration_col)
+        if not duration_str:
+            continue
+        try:
+            duration_minutes = int(duration_str)
+        except ValueError:
+            continue
+        end_datetime = start_datetime + datetime.timedelta(minutes=duration_minutes)
+
+        # Speakers, types and tracks repeat across rows (and across the
+        # shared per-track cache), so intern them to keep one copy of each.
+        speaker = sys.intern(_field(cells, speaker_col))
+        title = ''
+        for title_col in title_cols:
+            title = _field(cells, title_col)
+            if title:
+                break
+        synopsis = _field(cells, synopsis_col)
+        event_type = sys.intern(_field(cells, type_col, 'Talk'))
+
+        # Rows without a Track are stored under None and shown in every room
+        track = sys.intern(_field(cells, track_col)) or None
+        start_hhmm = start_datetime.strftime('%H:%M')
+        if speaker:
+            main_text = f"{speaker}\n{title}"
+            following_text = f"Following: {speaker} – {title} ({start_hhmm})"
+        else:
+            main_text = title
+            following_text = f"Following: {title} ({start_hhmm})"
+
+        event = Event(
+            track=track,
+            date=date_obj,
+            type=event_type,
+            is_session=event_type.lower() not in ('break', 'social'),
+            start=start_datetime,
+            end=end_datetime,
+            start_ts=int(start_datetime.timestamp()),
+            end_ts=int(end_datetime.timestamp()),
+            speaker=speaker,
+            title=title,
+            synopsis=synopsis,
+            start_hhmm=start_hhmm,
+            end_hhmm=end_datetime.strftime('%H:%M'),
+            main_text=main_text,
+            following_text=following_text,
+        )
+        by_track.setdefault(track, []).append(event)
+
+    for events in by_track.values():
+        # Sort by start time for predictable behaviour
+        events.sort(key=operator.attrgetter('start'))
+    return by_track
+
+
 def load_schedule(filename: str, track_name: str | None = None):
-    """Load schedule CSV and build a list of event dicts.
+    """Load schedule CSV and build a list of Events sorted by start time.
+
+    The file is parsed once (see _load_all) and shared by every display,
+    however many tracks are loaded from it.
 
     Expected CSV columns (case-sensitive headers):
 
@@ -37,68 +276,9 @@ def load_schedule(filename: str, track_name: str | None = None):
     - Synopsis     (optional, for display)
     - Type         (optional, e.g. Talk/Workshop/Break)
     """
-    schedule: list[dict] = []
     try:
-        with open(filename, mode='r', newline='', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                # Filter by track if requested and Track column present
-                row_track = row.get('Track')
-                if track_name and row_track and row_track.strip() != track_name:
-                    continue
-
-                # Parse date (per-row) or fall back to configured conference date
-                date_str = (row.get('Date') or '').strip()
-                if date_str:
-                    try:
-                        date_obj = datetime.datetime.strptime(date_str, '%Y-%m-%d').date()
-                    except ValueError:
-                        # If format is unexpected, skip this row rather than crash
-                        continue
-                else:
-                    date_obj = CONFERENCE_DATE
-
-                # Parse start time
-                time_str = (row.get('Start Time') or '').strip()
-                if not time_str:
-                    continue
-                try:
-                    start_time_obj = datetime.datetime.strptime(time_str, '%H:%M').time()
-                except ValueError:
-                    continue
-
-                start_datetime = datetime.datetime.combine(date_obj, start_time_obj)
-
-                # Duration and end time
-                duration_str = (row.get('Duration') or '').strip()
-                if not duration_str:
-                    continue
-                try:
-                    duration_minutes = int(duration_str)
-                except ValueError:
-                    continue
-                end_datetime = start_datetime + datetime.timedelta(minutes=duration_minutes)
-
-                speaker = (row.get('Speaker') or '').strip()
-                title = (row.get('Talk Title') or row.get('Title') or row.get('Speaker/Title') or '').strip()
-                synopsis = (row.get('Synopsis') or '').strip()
-                event_type = (row.get('Type') or 'Talk').strip()
-
-                event = {
-                    'track': row_track.strip() if row_track else None,
-                    'date': date_obj,
-                    'type': event_type,
-                    'start': start_datetime,
-                    'end': end_datetime,
-                    'speaker': speaker,
-                    'title': title,
-                    'synopsis': synopsis,
-                }
-                schedule.append(event)
-
-        # Sort by start time for predictable behaviour
-        schedule.sort(key=lambda e: e['start'])
-        return schedule
+        with _LOAD_LOCK:
+            by_track = _load_all(filename, os.stat(filename).st_mtime_ns)
     except FileNotFoundError:
         print(f"ERROR: Schedule file '{filename}' not found. Please create it.")
         return []
@@ -106,29 +286,53 @@ def load_schedule(filename: str, track_name: str | None = None):
         print(f"ERROR: Failed to load schedule: {e}")
         return []
 
+    if track_name:
+        # Rows without a Track apply to every room
+        streams = [by_track.get(track_name, []), by_track.get(None, [])]
+    else:
+        streams = list(by_track.values())
+    # Each track's events are already sorted, so merge rather than re-sort
+    return list(heapq.merge(*streams, key=operator.attrgetter('start')))
+
 
-def compute_display_state(schedule: list[dict], now: datetime.datetime):
+def compute_display_state(schedule: list[Event], starts: list[int],
+                          ends: list[int], max_ends: list[int], now: int):
     """Compute what should be shown on screen at a given time.
 
+    ``starts`` and ``ends`` are the start/end times of ``schedule`` (which
+    must be sorted by start time) as whole POSIX seconds, precomputed once
+    so each tick is a binary search over plain ints rather than a scan of
+    the whole schedule. ``max_ends[i]`` is the latest end of events
+    ``0..i`` (see running_max_ends), which lets overlapping events be
+    found without a scan. ``now`` is whole POSIX seconds too.
+
     Returns a dict with keys:
 
     - mode: 'normal', 'pre_start', 'in_talk', 'none'
-    - current: event dict for the talk currently in progress (if any)
+    - current: Event for the talk currently in progress (if any)
     - next_event: next upcoming event for this room (if any)
     - following_event: event after next_event (if any)
     - seconds_to_start: seconds until next_event starts (if applicable)
     """
+    # The talk in progress is the latest-started event that has not yet
+    # ended. That is usually the last one to start, but a long session can
+    # still be running after a shorter one inside it (e.g. a track-less row
+    # overlapping a room's talks), so step back while any earlier event
+    # is still running.
+    next_idx = bisect.bisect_right(starts, now)
+    idx = next_idx - 1
     current = None
-    upcoming: list[dict] = []
-
-    for e in schedule:
-        if e['start'] <= now < e['end']:
-            current = e
-        if e['start'] >= now:
-            upcoming.append(e)
-
-    next_event = upcoming[0] if upcoming else None
-    following_event = upcoming[1] if len(upcoming) > 1 else None
+    while idx >= 0 and max_ends[idx] > now:
+        if ends[idx] > now:
+            current = schedule[idx]
+            break
+        idx -= 1
+
+    # Events after that are the upcoming ones; index them directly rather
+    # than building a list when only the first two are ever shown.
+    count = len(schedule)
+    next_event = schedule[next_idx] if next_idx < count else None
+    following_event = schedule[next_idx + 1] if next_idx + 1 < count else None
 
     # No more events at all
     if not current and not next_event:
@@ -162,13 +366,11 @@ def compute_display_state(schedule: list[dict], now: datetime.datetime):
             'seconds_to_start': None,
         }
 
-    delta = next_event['start'] - now
-    seconds_to_start = int(delta.total_seconds())
+    seconds_to_start = starts[next_idx] - now
 
     # Only trigger the pre-start countdown for actual sessions
     # (talks/workshops), not for breaks or social events.
-    event_type = (next_event.get('type') or '').strip().lower()
-    if event_type not in ("break", "social") and seconds_to_start <= 5 * 60:
+    if next_event.is_session and seconds_to_start <= SECONDS_BEFORE_INTERMISSION_WARNING:
         mode = 'pre_start'
     else:
         mode = 'normal'
@@ -182,15 +384,50 @@ def compute_display_state(schedule: list[dict], now: datetime.datetime):
     }
 
 
-def format_timedelta(td):
-    total = int(td.total_seconds())
+def running_max_ends(ends: list[int]) -> list[int]:
+    """Return the running maximum of ``ends``, for compute_display_state."""
+    return list(itertools.accumulate(ends, max))
+
+
+def next_update_delay_ms(state: dict, now: int) -> int:
+    """Return how long the display can sleep before its content may change.
+
+    ``state`` is the result of compute_display_state for ``now``. Only the
+    pre-start countdown needs a tick every second; otherwise we wake at the
+    next boundary (talk ending, next event starting or entering its
+    pre-start window), capped at MAX_UPDATE_INTERVAL_MS.
+    """
+    mode = state['mode']
+    next_event = state['next_event']
+    if mode == 'pre_start':
+        return 1000
+    if mode == 'in_talk':
+        seconds = state['current'].end_ts - now
+        if next_event:
+            seconds = min(seconds, next_event.start_ts - now)
+    elif mode == 'normal':
+        seconds = state['seconds_to_start']
+        # Wake when the countdown would begin, or when the event starts if
+        # we are already inside that window (e.g. for a break).
+        if seconds > SECONDS_BEFORE_INTERMISSION_WARNING:
+            seconds -= SECONDS_BEFORE_INTERMISSION_WARNING
+    else:
+        return MAX_UPDATE_INTERVAL_MS
+    return min(max(seconds * 1000, 1000), MAX_UPDATE_INTERVAL_MS)
+
+
+# Every MM:SS string under an hour, built once so the countdown is a lookup
+_MMSS_CACHE = tuple(f"{i // 60:02d}:{i % 60:02d}" for i in range(3600))
+
+
+def format_seconds(total: int) -> str:
     if total < 0:
         total = 0
+    if total < 3600:
+        return _MMSS_CACHE[total]
     hrs, rem = divmod(total, 3600)
     mins, secs = divmod(rem, 60)
-    if hrs:
-        return f"{hrs:02d}:{mins:02d}:{secs:02d}"
-    return f"{mins:02d}:{secs:02d}"
+    return f"{hrs:02d}:{mins:02d}:{secs:02d}"
 
 class SpeakerDisplayApp:
     def __init__(self, root, schedule_file: str = SCHEDULE_FILE, track_name: str | None = None):
@@ -199,7 +436,15 @@ class SpeakerDisplayApp:
         self.root.configure(bg=PALETTE_BASE_BG)
 
         self.track_name = track_name
-        self.schedule = load_schedule(schedule_file, track_name=track_name)
+        # The schedule is loaded in the background (see _bg_load) so the
+        # window paints straight away; until then the fail-safe is shown.
+        self.schedule: list[Event] = []
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        self.max_ends: list[int] = []
+        self._loading = True
+        # Set by the loader thread; update() installs it on the Tk thread.
+        self._loaded_schedule: list[Event] | None = None
 
         self.large_font = font.Font(family='Helvetica', size=48, weight='bold')
         self.mid_font = font.Font(family='Helvetica', size=28)
@@ -219,14 +464,54 @@ class SpeakerDisplayApp:
         self.info_label.pack(pady=10)
         self.extra_label.pack(pady=(10, 20))
 
-        # Start update loop
-        self.update_interval_ms = 1000
+        # Start update loop. While waiting for the schedule to load we poll
+        # at this interval; otherwise update() works out when to wake next.
+        self.update_interval_ms = 100
+        # Key of the last rendered state; see update()
+        self._last_state_key = None
+        # Text last set on each label; see _set_text()
+        self._label_text: dict[tk.Label, str] = {}
+        # (bg, title_fg, body_fg, extra_fg) last applied; see _apply_theme()
+        self._current_theme: tuple[str, str, str, str] | None = None
+        self._mode_dispatch = self._build_renderers()
         self.update()
 
+        threading.Thread(target=self._bg_load, args=(schedule_file, track_name), daemon=True).start()
+
+    def _bg_load(self, schedule_file: str, track_name: str | None):
+        """Load the schedule off the Tk thread.
+
+        Only the result is stored here: Tk must not be called from this
+        thread, so update() picks it up on its next poll.
+        """
+        self._loaded_schedule = load_schedule(schedule_file, track_name=track_name)
+
+    def _install_schedule(self, schedule: list[Event]):
+        """Swap in a freshly loaded schedule."""
+        self.schedule = schedule
+        # The schedule never changes once loaded, so cache the sorted
+        # start/end timestamps used to look up the current event each tick.
+        self.starts = [e.start_ts for e in schedule]
+        self.ends = [e.end_ts for e in schedule]
+        self.max_ends = running_max_ends(self.ends)
+        self._loading = False
+
+    def _set_text(self, label: tk.Label, text: str):
+        """Set a label's text, skipping Tk's re-layout if it is unchanged."""
+        if self._label_text.get(label) != text:
+            self._label_text[label] = text
+            label.config(text=text)
+
     def _apply_theme(self, *, bg: str, title_fg: str, body_fg: str, extra_fg: str | None = None):
         """Apply a simple colour theme to all labels and the window."""
         if extra_fg is None:
             extra_fg = body_fg
+        # Themes only change on mode transitions, so skip re-setting options
+        # on every label when the requested theme is already showing.
+        theme = (bg, title_fg, body_fg, extra_fg)
+        if theme == self._current_theme:
+            return
+        self._current_theme = theme
         self.root.configure(bg=bg)
         self.header_label.config(bg=bg, fg=body_fg)
         self.status_label.config(bg=bg, fg=body_fg)
@@ -234,109 +519,145 @@ class SpeakerDisplayApp:
         self.info_label.config(bg=bg, fg=body_fg)
         self.extra_label.config(bg=bg, fg=extra_fg)
 
-    def update(self):
-        now = datetime.datetime.now().replace(microsecond=0)
-        if not self.schedule:
-            self.status_label.config(text='FAIL-SAFE: No schedule loaded')
-            self.title_label.config(text='Waiting for schedule...')
-            self.info_label.config(text=f"Ensure {SCHEDULE_FILE} is present and formatted correctly.")
-            self.extra_label.config(text='')
-            self.root.after(self.update_interval_ms, self.update)
-            return
-
-        state = compute_display_state(self.schedule, now)
-        mode = state['mode']
-        current = state['current']
-        next_event = state['next_event']
-        following = state['following_event']
-
-        if mode == 'none':
-            self._apply_theme(bg=PALETTE_BASE_BG, title_fg=PALETTE_TEXT_DARK, body_fg=PALETTE_TEXT_DARK)
-            self.status_label.config(text='No more events in this room today')
-            self.title_label.config(text='Thank you for attending')
-            self.info_label.config(text='')
-            self.extra_label.config(text='')
-
-        elif mode == 'in_talk' and current:
+    def _build_renderers(self):
+        """Build the render function for each display mode.
+
+        Each closure binds the labels and helpers it uses as locals, so a
+        tick only has to look up the renderer for the current mode. All take
+        (current, next_event, following, secs, same_slide), where same_slide
+        means only the countdown has changed since the last render.
+        """
+        set_text = self._set_text
+        apply_theme = self._apply_theme
+        status_label = self.status_label
+        title_label = self.title_label
+        info_label = self.info_label
+        extra_label = self.extra_label
+
+        def render_none(current, next_event, following, secs, same_slide):
+            apply_theme(bg=PALETTE_BASE_BG, title_fg=PALETTE_TEXT_DARK, body_fg=PALETTE_TEXT_DARK)
+            set_text(status_label, 'No more events in this room today')
+            set_text(title_label, 'Thank you for attending')
+            set_text(info_label, '')
+            set_text(extra_label, '')
+
+        def render_in_talk(current, next_event, following, secs, same_slide):
             # Talk in progress – show that talk only, no countdown, until end time
-            speaker = current['speaker'] or ''
-            title = current['title'] or ''
-            synopsis = current['synopsis'] or ''
-            end_time_str = current['end'].strftime('%H:%M')
-
-            self._apply_theme(bg=PALETTE_TALK_BG, title_fg=PALETTE_TEXT_LIGHT, body_fg=PALETTE_TEXT_LIGHT)
-            self.status_label.config(text='Now on stage')
-            main_text = f"{speaker}\n{title}" if speaker else title
-            self.title_label.config(text=main_text)
-            self.info_label.config(text=f"Scheduled to end at {end_time_str}")
-            self.extra_label.config(text=synopsis)
-
-        elif mode == 'pre_start' and next_event:
-            # Within 5 minutes of next talk – focus only on next talk and countdown
-            speaker = next_event['speaker'] or ''
-            title = next_event['title'] or ''
-            synopsis = next_event['synopsis'] or ''
-            start_time_str = next_event['start'].strftime('%H:%M')
+            apply_theme(bg=PALETTE_TALK_BG, title_fg=PALETTE_TEXT_LIGHT, body_fg=PALETTE_TEXT_LIGHT)
+            set_text(status_label, 'Now on stage')
+            set_text(title_label, current.main_text)
+            set_text(info_label, f"Scheduled to end at {current.end_hhmm}")
+            set_text(extra_label, current.synopsis)
 
-            secs = state['seconds_to_start'] or 0
+        def render_pre_start(current, next_event, following, secs, same_slide):
+            # Within 5 minutes of next talk – focus only on next talk and countdown
+            secs = secs or 0
             # Round up to whole minutes for the prominent warning (5,4,3,2,1)
             minutes_remaining = max((secs + 59) // 60, 0)
 
-            self._apply_theme(bg=PALETTE_TALK_BG, title_fg=PALETTE_TEXT_LIGHT, body_fg=PALETTE_TEXT_LIGHT)
+            if not same_slide:
+                apply_theme(bg=PALETTE_TALK_BG, title_fg=PALETTE_TEXT_LIGHT, body_fg=PALETTE_TEXT_LIGHT)
+                set_text(title_label, next_event.main_text)
+                set_text(extra_label, next_event.synopsis)
 
-            countdown_str = format_timedelta(datetime.timedelta(seconds=secs))
-            self.status_label.config(text=f"Starting soon – {minutes_remaining} minute warning")
-            main_text = f"{speaker}\n{title}" if speaker else title
-            self.title_label.config(text=main_text)
-            self.info_label.config(text=f"Scheduled start: {start_time_str}  ·  T-minus {countdown_str}")
-            self.extra_label.config(text=synopsis)
+            countdown_str = format_seconds(secs)
+            set_text(status_label, f"Starting soon – {minutes_remaining} minute warning")
+            set_text(info_label, f"Scheduled start: {next_event.start_hhmm}  ·  T-minus {countdown_str}")
 
-        elif mode == 'normal' and next_event:
+        def render_normal(current, next_event, following, secs, same_slide):
             # Normal state – show next and following events
-            speaker = next_event['speaker'] or ''
-            title = next_event['title'] or ''
-            start_time_str = next_event['start'].strftime('%H:%M')
-
-            self._apply_theme(bg=PALETTE_BASE_BG, title_fg=PALETTE_TEXT_DARK, body_fg=PALETTE_TEXT_DARK)
-            self.status_label.config(text='Upcoming in this room')
-            main_text = f"{speaker}\n{title}" if speaker else title
-            self.title_label.config(text=main_text)
-            self.info_label.config(text=f"Starts at {start_time_str}")
-
-            if following:
-                f_speaker = following['speaker'] or ''
-                f_title = following['title'] or ''
-                f_start = following['start'].strftime('%H:%M')
-                following_text = f"Following: {f_speaker} – {f_title} ({f_start})" if f_speaker else f"Following: {f_title} ({f_start})"
-                self.extra_label.config(text=following_text)
-            else:
-                self.extra_label.config(text='')
+            apply_theme(bg=PALETTE_BASE_BG, title_fg=PALETTE_TEXT_DARK, body_fg=PALETTE_TEXT_DARK)
+            set_text(status_label, 'Upcoming in this room')
+            set_text(title_label, next_event.main_text)
+            set_text(info_label, f"Starts at {next_event.start_hhmm}")
+            set_text(extra_label, following.following_text if following else '')
 
-        else:
-            # Fallback – shouldn't normally hit
-            self._apply_theme(bg=PALETTE_BASE_BG, title_fg=PALETTE_TEXT_DARK, body_fg=PALETTE_TEXT_DARK)
-            self.status_label.config(text='Schedule state unknown')
-            self.title_label.config(text='')
-            self.info_label.config(text='')
-            self.extra_label.config(text='')
+        return {
+            'none': render_none,
+            'in_talk': render_in_talk,
+            'pre_start': render_pre_start,
+            'normal': render_normal,
+        }
 
-        self.root.after(self.update_interval_ms, self.update)
+    def _render_unknown(self, current, next_event, following, secs, same_slide):
+        # Fallback – shouldn't normally hit
+        self._apply_theme(bg=PALETTE_BASE_BG, title_fg=PALETTE_TEXT_DARK, body_fg=PALETTE_TEXT_DARK)
+        self._set_text(self.status_label, 'Schedule state unknown')
+        self._set_text(self.title_label, '')
+        self._set_text(self.info_label, '')
+        self._set_text(self.extra_label, '')
+
+    def update(self):
+        now = int(time.time())
+        if self._loading and self._loaded_schedule is not None:
+            self._install_schedule(self._loaded_schedule)
+        if not self.schedule:
+            if self._last_state_key != 'no_schedule':
+                self._last_state_key = 'no_schedule'
+                self._set_text(self.status_label, 'FAIL-SAFE: No schedule loaded')
+                self._set_text(self.title_label, 'Waiting for schedule...')
+                self._set_text(self.info_label, f"Ensure {SCHEDULE_FILE} is present and formatted correctly.")
+                self._set_text(self.extra_label, '')
+            # Once loading has finished an empty schedule will stay empty
+            delay_ms = self.update_interval_ms if self._loading else MAX_UPDATE_INTERVAL_MS
+            self.root.after(delay_ms, self.update)
+            return
+
+        state = compute_display_state(self.schedule, self.starts, self.ends, self.max_ends, now)
+        mode = state['mode']
+        current = state['current']
+        next_event = state['next_event']
+        following = state['following_event']
+        delay_ms = next_update_delay_ms(state, now)
+
+        # Only the pre-start countdown changes from one second to the
+        # next; every other slide depends solely on the mode and events
+        # shown, so skip re-rendering when none of those have changed.
+        secs = state['seconds_to_start'] if mode == 'pre_start' else None
+        state_key = (mode, id(current), id(next_event), secs)
+        if state_key == self._last_state_key:
+            self.root.after(delay_ms, self.update)
+            return
+        last_key = self._last_state_key
+        same_slide = isinstance(last_key, tuple) and last_key[:3] == state_key[:3]
+        self._last_state_key = state_key
+
+        render = self._mode_dispatch.get(mode, self._render_unknown)
+        render(current, next_event, following, secs, same_slide)
+
+        self.root.after(delay_ms, self.update)
 
 if __name__ == "__main__":
     # Optional: pass track/room name on the command line so the
     # same script can be used for all five tracks, e.g.:
     #   python script.py "STUDIO A"
-    cli_track_arg = sys.argv[1] if len(sys.argv) > 1 else None
-
-    # For non-technical users, show a simple dialog asking which
-    # room they are in. If a command-line argument is provided,
-    # that takes precedence and skips the dialog.
-    if cli_track_arg:
-        chosen_track = cli_track_arg
-        root = tk.Tk()
+    # or drive several rooms from one process, each in its own window
+    # sharing a single parsed schedule:
+    #   python script.py --multi "STUDIO A" "STUDIO B"
+    multi_tracks = sys.argv[2:] if sys.argv[1:2] == ['--multi'] else None
+    cli_track_arg = sys.argv[1] if len(sys.argv) > 1 and multi_tracks is None else None
+
+    if multi_tracks == []:
+        sys.exit('Usage: python script.py --multi TRACK [TRACK ...]')
+
+    # Every path uses this one Tk root: creating a second root is slow and
+    # fragile, so the room selection dialog is shown inside it too.
+    root = tk.Tk()
+
+    if multi_tracks:
+        # The first room uses the root window and each other room gets a
+        # Toplevel, all updated from the same event loop.
+        windows = [root] + [tk.Toplevel(root) for _ in multi_tracks[1:]]
+        apps = [
+            SpeakerDisplayApp(window, schedule_file=SCHEDULE_FILE, track_name=track)
+            for window, track in zip(windows, multi_tracks)
+        ]
+    elif cli_track_arg:
+        app = SpeakerDisplayApp(root, schedule_file=SCHEDULE_FILE, track_name=cli_track_arg)
     else:
-        # Use a temporary root for the selection dialog
-        root = tk.Tk()
+        # For non-technical users, show a simple dialog asking which
+        # room they are in. If a command-line argument is provided,
+        # that takes precedence and skips the dialog.
         root.title("Select room/track")
 
         # For testing with example.csv we expose the test tracks.
@@ -350,30 +671,36 @@ if __name__ == "__main__":
 
         selected = tk.StringVar(value=tracks[0])
 
-        label = tk.Label(root, text="Which room are you in?", padx=20, pady=10)
+        # Keep the selection widgets in one frame so they can be torn
+        # down together once a room is chosen.
+        selector = tk.Frame(root)
+        selector.pack()
+
+        label = tk.Label(selector, text="Which room are you in?", padx=20, pady=10)
         label.pack()
 
-        option = tk.OptionMenu(root, selected, *tracks)
+        option = tk.OptionMenu(selector, selected, *tracks)
         option.pack(padx=20, pady=10)
 
-        # Use a one-element list so the nested callback can modify
-        # the chosen track without needing 'nonlocal'.
-        chosen_track_box = [tracks[0]]
+        # Use a one-element list so the nested callback can keep a
+        # reference to the display without needing 'global'.
+        app_box: list[SpeakerDisplayApp] = []
+
+        def start_display(chosen_track):
+            selector.destroy()
+            root.protocol("WM_DELETE_WINDOW", root.destroy)
+            # The display builds its widgets into the same root window
+            app_box.append(SpeakerDisplayApp(root, schedule_file=SCHEDULE_FILE, track_name=chosen_track))
 
         def on_start():
-            chosen_track_box[0] = selected.get()
-            root.destroy()
+            start_display(selected.get())
 
-        start_button = tk.Button(root, text="Start display", command=on_start, padx=20, pady=5)
+        start_button = tk.Button(selector, text="Start display", command=on_start, padx=20, pady=5)
         start_button.pack(pady=(0, 20))
 
-        root.mainloop()
-
-        # Re-create the main fullscreen window
-        root = tk.Tk()
-        chosen_track = chosen_track_box[0]
+        # As before, closing the picker starts the display on the first room
+        root.protocol("WM_DELETE_WINDOW", lambda: start_display(tracks[0]))
 
-    app = SpeakerDisplayApp(root, schedule_file=SCHEDULE_FILE, track_name=chosen_track)
     # Toggle fullscreen here if desired for the conference machines.
     root.attributes('-fullscreen', False)
     try:
@@ -0,0 +1,149 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+import script
+
+
+def write_csv(text: str) -> str:
+    """Write ``text`` to a temporary CSV file and return its path."""
+    fd, path = tempfile.mkstemp(suffix='.csv')
+    with os.fdopen(fd, 'w', newline='', encoding='utf-8') as file:
+        file.write(text)
+    return path
+
+
+def at(hhmm: str) -> int:
+    """Timestamp for HH:MM (or HH:MM:SS) on the test conference day."""
+    return int(datetime.datetime.combine(datetime.date(2026, 7, 2), datetime.time.fromisoformat(hhmm)).timestamp())
+
+
+MODES_CSV = (
+    "Track,Date,Start Time,Duration,Speaker,Talk Title,Synopsis,Type\n"
+    "ROOM,2026-07-02,09:00,30,Alice,First talk,,Talk\n"
+    "ROOM,2026-07-02,10:00,30,Bob,Second talk,,Talk\n"
+    "ROOM,2026-07-02,11:00,30,,Coffee,,Break\n"
+)
+
+# A track-less workshop applies to every room and overlaps a short talk
+OVERLAP_CSV = (
+    "Track,Date,Start Time,Duration,Speaker,Talk Title,Synopsis,Type\n"
+    ",2026-07-02,09:00,120,,Long workshop,,Workshop\n"
+    "ROOM,2026-07-02,09:30,10,,Short talk,,Talk\n"
+)
+
+
+class ScheduleTestCase(unittest.TestCase):
+    def load(self, text: str, track_name: str):
+        path = write_csv(text)
+        self.addCleanup(os.remove, path)
+        self.schedule = script.load_schedule(path, track_name=track_name)
+        self.starts = [e.start_ts for e in self.schedule]
+        self.ends = [e.end_ts for e in self.schedule]
+        self.max_ends = script.running_max_ends(self.ends)
+
+    def state(self, hhmm: str) -> dict:
+        return script.compute_display_state(self.schedule, self.starts, self.ends, self.max_ends, at(hhmm))
+
+
+class ComputeDisplayStateTest(ScheduleTestCase):
+    def test_modes(self):
+        self.load(MODES_CSV, 'ROOM')
+        state = self.state('08:00')
+        self.assertEqual(state['mode'], 'normal')
+        self.assertEqual(state['next_event'].title, 'First talk')
+        self.assertEqual(state['following_event'].title, 'Second talk')
+
+        state = self.state('09:10')
+        self.assertEqual(state['mode'], 'in_talk')
+        self.assertEqual(state['current'].title, 'First talk')
+        self.assertEqual(state['next_event'].title, 'Second talk')
+
+        state = self.state('09:57')
+        self.assertEqual(state['mode'], 'pre_start')
+        self.assertEqual(state['seconds_to_start'], 3 * 60)
+
+        # Breaks never get the pre-start countdown
+        self.assertEqual(self.state('10:58')['mode'], 'normal')
+        self.assertEqual(self.state('12:00')['mode'], 'none')
+
+    def test_overlapping_events(self):
+        # The workshop must stay on screen after the short talk ends
+        self.load(OVERLAP_CSV, 'ROOM')
+        self.assertEqual(self.state('09:15')['current'].title, 'Long workshop')
+        self.assertEqual(self.state('09:35')['current'].title, 'Short talk')
+        for hhmm in ('09:45', '10:30'):
+            state = self.state(hhmm)
+            self.assertEqual(state['mode'], 'in_talk')
+            self.assertEqual(state['current'].title, 'Long workshop')
+        self.assertEqual(self.state('11:00')['mode'], 'none')
+
+
+class NextUpdateDelayTest(ScheduleTestCase):
+    def delay(self, hhmm: str, now: str | None = None) -> int:
+        return script.next_update_delay_ms(self.state(hhmm), at(now or hhmm))
+
+    def test_pre_start_ticks_every_second(self):
+        self.load(MODES_CSV, 'ROOM')
+        self.assertEqual(self.delay('09:57'), 1000)
+
+    def test_normal_wakes_at_pre_start_boundary(self):
+        self.load(MODES_CSV, 'ROOM')
+        # 5.5 minutes before the talk: the countdown starts in 30 s
+        self.assertEqual(self.delay('08:54:30'), 30 * 1000)
+
+    def test_break_within_warning_wakes_at_its_start(self):
+        self.load(MODES_CSV, 'ROOM')
+        self.assertEqual(self.state('10:59:20')['mode'], 'normal')
+        self.assertEqual(self.delay('10:59:20'), 40 * 1000)
+
+    def test_in_talk_wakes_at_end_or_next_start(self):
+        self.load(MODES_CSV, 'ROOM')
+        self.assertEqual(self.delay('09:29:45'), 15 * 1000)
+        # Inside the workshop, the overlapping talk starts before it ends
+        self.load(OVERLAP_CSV, 'ROOM')
+        self.assertEqual(self.delay('09:29:10'), 50 * 1000)
+        self.assertEqual(self.delay('09:39:30'), 30 * 1000)
+
+    def test_floor_and_cap(self):
+        self.load(MODES_CSV, 'ROOM')
+        # A tick running late past the boundary still waits at least 1 s
+        self.assertEqual(self.delay('09:29:45', now='09:30:30'), 1000)
+        self.assertEqual(self.delay('08:00'), script.MAX_UPDATE_INTERVAL_MS)
+        self.assertEqual(self.delay('09:10'), script.MAX_UPDATE_INTERVAL_MS)
+        self.assertEqual(self.delay('12:00'), script.MAX_UPDATE_INTERVAL_MS)
+
+
+class LoadScheduleTest(unittest.TestCase):
+    CSV = (
+        "Track,Date,Start Time,Duration,Speaker,Talk Title,Synopsis,Type\n"
+        "# comment lines are skipped\n"
+        "ROOM,2026-07-02,09:00,30,Alice,\"Quoted, title\",,Talk\n"
+        "ROOM,2026-07-02,10:00,30\n"
+        "ROOM,2026-07-02,11:00,30,,Coffee,,Break\n"
+    )
+
+    def load(self, min_file_size: int):
+        path = write_csv(self.CSV)
+        self.addCleanup(os.remove, path)
+        original = script.PYARROW_MIN_FILE_SIZE
+        script.PYARROW_MIN_FILE_SIZE = min_file_size
+        self.addCleanup(setattr, script, 'PYARROW_MIN_FILE_SIZE', original)
+        return script.load_schedule(path, track_name='ROOM')
+
+    def test_csv_reader(self):
+        schedule = self.load(1 << 30)
+        self.assertEqual([e.start_hhmm for e in schedule], ['09:00', '10:00', '11:00'])
+        self.assertEqual(schedule[0].title, 'Quoted, title')
+        # Short rows still load, defaulting the missing columns
+        self.assertEqual((schedule[1].type, schedule[1].title), ('Talk', ''))
+        self.assertFalse(schedule[2].is_session)
+
+    @unittest.skipUnless(script._HAS_PYARROW, 'pyarrow is not installed')
+    def test_pyarrow_reader_matches_csv_reader(self):
+        self.assertEqual(self.load(-1), self.load(1 << 30))
+
+
+if __name__ == '__main__':
+    unittest.main()